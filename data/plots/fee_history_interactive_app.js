@@ -25,6 +25,10 @@
   const SHARED_RUNS_HASH_KEY = 'sharedRuns';
   const SHARED_RUNS_PAYLOAD_VERSION = 1;
   const SHARED_RUNS_MAX_URL_LENGTH = 200000;
+  const FOLLOW_QUERY_KEY = 'follow';
+  const FOLLOW_URL_QUERY_KEY = 'followUrl';
+  const FOLLOW_QUERY_TRUE_VALUES = ['1', 'true', 'yes', 'on'];
+  const FOLLOW_EVENTS_PATH = './follow/events';
   const SAVED_RUN_COLORS = Object.freeze([
     '#0ea5e9',
     '#f97316',
@@ -73,6 +77,7 @@
   let ANCHOR_TIMESTAMP_SEC = 0;
   let TIME_ANCHOR_SOURCE = 'none';
   let datasetReady = false;
+  let followDatasetId = null;
   const datasetRangeById = Object.create(null);
 
   const minInput = document.getElementById('minBlock');
@@ -292,6 +297,19 @@
     }
   }
 
+  function selectedFollowStreamFromQuery() {
+    try {
+      const params = new URLSearchParams(window.location.search || '');
+      const customUrl = params.get(FOLLOW_URL_QUERY_KEY);
+      if (customUrl) return String(customUrl);
+      const raw = params.get(FOLLOW_QUERY_KEY);
+      if (raw == null) return null;
+      return FOLLOW_QUERY_TRUE_VALUES.includes(raw.trim().toLowerCase()) ? FOLLOW_EVENTS_PATH : null;
+    } catch (e) {
+      return null;
+    }
+  }
+
   function selectedSharedRunsFromHash() {
     try {
       const rawHash = window.location.hash || '';
@@ -522,7 +540,19 @@
     });
   }
 
-  async function activateDataset(datasetId, preserveRange = true) {
+  function applyDatasetTimeAnchor(rawAnchor) {
+    const anchor = rawAnchor || {};
+    HAS_BLOCK_TIME_ANCHOR = Boolean(anchor.has_anchor);
+    BLOCK_TIME_APPROX_SECONDS = Number(anchor.seconds_per_block);
+    if (!Number.isFinite(BLOCK_TIME_APPROX_SECONDS) || BLOCK_TIME_APPROX_SECONDS <= 0) {
+      BLOCK_TIME_APPROX_SECONDS = L1_BLOCK_TIME_SECONDS;
+    }
+    ANCHOR_BLOCK = Number.isFinite(Number(anchor.anchor_block)) ? Number(anchor.anchor_block) : MIN_BLOCK;
+    ANCHOR_TIMESTAMP_SEC = Number.isFinite(Number(anchor.anchor_ts_sec)) ? Number(anchor.anchor_ts_sec) : 0;
+    TIME_ANCHOR_SOURCE = anchor.source ? String(anchor.source) : 'none';
+  }
+
+  async function activateDataset(datasetId, preserveRange = true, initialRange = null) {
     setUiBusy(true);
     try {
       const id = String(datasetId || '');
@@ -548,16 +578,7 @@
 
       MIN_BLOCK = blocks[0];
       MAX_BLOCK = blocks[blocks.length - 1];
-
-      const anchor = payload.timeAnchor || {};
-      HAS_BLOCK_TIME_ANCHOR = Boolean(anchor.has_anchor);
-      BLOCK_TIME_APPROX_SECONDS = Number(anchor.seconds_per_block);
-      if (!Number.isFinite(BLOCK_TIME_APPROX_SECONDS) || BLOCK_TIME_APPROX_SECONDS <= 0) {
-        BLOCK_TIME_APPROX_SECONDS = L1_BLOCK_TIME_SECONDS;
-      }
-      ANCHOR_BLOCK = Number.isFinite(Number(anchor.anchor_block)) ? Number(anchor.anchor_block) : MIN_BLOCK;
-      ANCHOR_TIMESTAMP_SEC = Number.isFinite(Number(anchor.anchor_ts_sec)) ? Number(anchor.anchor_ts_sec) : 0;
-      TIME_ANCHOR_SOURCE = anchor.source ? String(anchor.source) : 'none';
+      applyDatasetTimeAnchor(payload.timeAnchor);
 
       activeDatasetId = id;
       if (datasetRangeInput) datasetRangeInput.value = id;
@@ -566,7 +587,11 @@
       let nextMax = MAX_BLOCK;
       const queryDatasetId = selectedDatasetFromQuery();
       const queryRange = queryDatasetId === id ? selectedRangeFromQuery() : null;
-      if (preserveRange) {
+      if (initialRange) {
+        const clipped = clampRange(initialRange[0], initialRange[1]);
+        nextMin = clipped[0];
+        nextMax = clipped[1];
+      } else if (preserveRange) {
         const savedRange = datasetRangeById[id];
         if (savedRange && savedRange.length === 2) {
           const clipped = clampRange(savedRange[0], savedRange[1]);
@@ -1165,10 +1190,6 @@
     return Math.max(lo, Math.min(hi, x));
   }
 
-  function buildL2GasSeries(n, baseGasPerL1Block, scenario) {
-    return simCore.buildL2GasSeries(n, baseGasPerL1Block, scenario);
-  }
-
   let derivedL2GasPerL1Block = [];
   let derivedL2GasPerL1BlockBase = [];
   let derivedL2GasPerL2Block = [];
@@ -1196,6 +1217,7 @@
   let derivedClampState = [];
   let derivedVaultEth = [];
   let derivedVaultTargetEth = [];
+  let liveSimulation = null;
   const savedRunManager = createSavedRunManager();
   let currentRunSnapshot = null;
 
@@ -1496,15 +1518,16 @@
       if (!rangeInfo || !runs.length) return 0;
       let rerunCount = 0;
       const nowTs = Date.now();
-      for (const run of runs) {
-        if (!run) continue;
-        run.series = replayFn(run, rangeInfo);
+      const seriesByRun = replayFn(runs, rangeInfo);
+      runs.forEach(function (run, idx) {
+        if (!run) return;
+        run.series = seriesByRun[idx];
         run.datasetId = datasetId;
         run.minBlock = rangeInfo.minB;
         run.maxBlock = rangeInfo.maxB;
         run.lastRecomputedAt = nowTs;
         rerunCount += 1;
-      }
+      });
       if (rerunCount > 0) persist();
       return rerunCount;
     }
@@ -1610,48 +1633,58 @@
     );
   }
 
-  function replaySavedRunForRange(run, rangeInfo) {
+  function replaySavedRunsForRange(runs, rangeInfo) {
     const n = blocks.length;
     const hidden = new Array(n).fill(null);
-    if (!run || !run.params || !rangeInfo) {
+    const out = runs.map(function () {
       return { chargedFee: hidden.slice(), vault: hidden.slice() };
-    }
-
-    const runParams = normalizeRunParams(run.params);
-    const demandScalars = deriveDemandScalars(runParams);
-    const localGasSeries = buildL2GasSeries(
-      rangeInfo.n,
-      demandScalars.l2GasPerL1BlockTarget,
-      runParams.l2GasScenario
-    );
-    const baseFeeSlice = baseFeeGwei.slice(rangeInfo.i0, rangeInfo.i1 + 1);
-    const blobFeeSlice = blobFeeGwei.slice(rangeInfo.i0, rangeInfo.i1 + 1);
-    const controllerCfg = buildCoreControllerConfig(runParams);
-    const replay = simCore.simulateSeries({
-      ...controllerCfg,
-      baseFeeGwei: baseFeeSlice,
-      blobFeeGwei: blobFeeSlice,
-      l2GasPerL1BlockSeries: localGasSeries,
-      fullLength: rangeInfo.n,
-      rangeStart: 0,
-      rangeEnd: rangeInfo.n - 1,
-      blockIndexOffset: rangeInfo.i0,
-      collectBreakdown: false
     });
+    if (!rangeInfo) return out;
+
+    // Replay every run in one lockstep pass so fee conversion, demand paths
+    // and blob estimates are shared across runs with the same assumptions.
+    const replayIdx = [];
+    const configs = [];
+    runs.forEach(function (run, idx) {
+      if (!run || !run.params) return;
+      const runParams = normalizeRunParams(run.params);
+      const demandScalars = deriveDemandScalars(runParams);
+      replayIdx.push(idx);
+      configs.push({
+        ...buildCoreControllerConfig(runParams),
+        l2GasPerL1BlockTarget: demandScalars.l2GasPerL1BlockTarget,
+        l2GasScenario: runParams.l2GasScenario,
+      });
+    });
+    if (!configs.length) return out;
 
-    const chargedFee = new Array(n).fill(null);
-    const vaultSeries = new Array(n).fill(null);
-    for (let local = 0; local < rangeInfo.n; local++) {
-      const i = rangeInfo.i0 + local;
-      chargedFee[i] = replay.chargedFeeGwei[local];
-      vaultSeries[i] = replay.vaultEth[local];
+    const replay = simCore.simulateSeriesBatch({
+      baseFeeGwei,
+      blobFeeGwei,
+      fullLength: n,
+      rangeStart: rangeInfo.i0,
+      rangeEnd: rangeInfo.i1,
+      blockIndexOffset: 0,
+      configs,
+    });
+    for (let m = 0; m < replay.width; m++) {
+      const series = out[replayIdx[m]];
+      for (let local = 0; local < replay.length; local++) {
+        const i = replay.rangeStart + local;
+        series.chargedFee[i] = replay.chargedFeeGwei[local * replay.width + m];
+        series.vault[i] = replay.vaultEth[local * replay.width + m];
+      }
     }
-    return { chargedFee, vault: vaultSeries };
+    return out;
+  }
+
+  function replaySavedRunForRange(run, rangeInfo) {
+    return replaySavedRunsForRange([run], rangeInfo)[0];
   }
 
   function rerunSavedRunsForCurrentRange() {
     const rangeInfo = currentRangeIndices();
-    return savedRunManager.recomputeForRange(rangeInfo, replaySavedRunForRange, activeDatasetId);
+    return savedRunManager.recomputeForRange(rangeInfo, replaySavedRunsForRange, activeDatasetId);
   }
 
   function recomputeSavedRunsNow() {
@@ -1707,16 +1740,21 @@
     }
 
     const assumptions = readAssumptionOverridesFromUi();
-    const savedRuns = savedRunManager.getRuns();
+    const savedRuns = savedRunManager.getRuns().filter(function (run) {
+      return run && run.params;
+    });
     const nowTs = Date.now();
     let updatedCount = 0;
 
     for (const run of savedRuns) {
-      if (!run || !run.params) continue;
       const mergedParams = normalizeRunParams({ ...run.params, ...assumptions });
       run.params = mergedParams;
       run.tps = Number.isFinite(mergedParams.l2Tps) ? mergedParams.l2Tps : run.tps;
-      run.series = replaySavedRunForRange(run, rangeInfo);
+    }
+    const seriesByRun = replaySavedRunsForRange(savedRuns, rangeInfo);
+    for (let idx = 0; idx < savedRuns.length; idx++) {
+      const run = savedRuns[idx];
+      run.series = seriesByRun[idx];
       run.datasetId = activeDatasetId;
       run.minBlock = rangeInfo.minB;
       run.maxBlock = rangeInfo.maxB;
@@ -2194,6 +2232,74 @@
     legendRows[seriesIndex].style.display = show ? '' : 'none';
   }
 
+  function refreshDerivedPlots(nextRange, rerunSavedRuns = true) {
+    const preservedRange = nextRange || getCurrentXRange();
+
+    if (l2GasPlot && costPlot && proposalPLPlot && requiredFeePlot && chargedFeeOnlyPlot && controllerPlot && feedbackPlot && vaultPlot) {
+      l2GasPlot.setData([blocks, derivedL2GasPerL2Block, derivedL2GasPerL2BlockBase]);
+      costPlot.setData([blocks, derivedGasCostEth, derivedBlobCostEth, derivedPostingCostEth]);
+      const proposalPnLValues = [];
+      for (let i = 0; i < derivedPostingPnLEth.length; i++) {
+        const v = derivedPostingPnLEth[i];
+        if (v != null) proposalPnLValues.push(v);
+      }
+      proposalPLPlot.setData([
+        derivedPostingPnLBlocks,
+        proposalPnLValues,
+        new Array(proposalPnLValues.length).fill(0)
+      ]);
+      controllerPlot.setData([
+        blocks,
+        derivedFeedforwardFeeGwei,
+        derivedPTermFeeGwei,
+        derivedITermFeeGwei,
+        derivedDTermFeeGwei,
+        derivedFeedbackFeeGwei,
+        derivedChargedFeeGwei
+      ]);
+      feedbackPlot.setData([
+        blocks,
+        derivedDeficitEth,
+        derivedEpsilon,
+        derivedDerivative,
+        derivedIntegral
+      ]);
+      refreshComparisonPlots();
+
+      if (preservedRange) {
+        applyRange(preservedRange[0], preservedRange[1], null, rerunSavedRuns);
+      }
+    }
+  }
+
+  function updateLatestDerivedStats(targetVaultEth) {
+    const lastIdx = blocks.length - 1;
+    latestPostingCost.textContent = `${formatNum(derivedPostingCostEth[lastIdx], 6)} ETH`;
+    if (derivedRequiredFeeGwei[lastIdx] == null || derivedChargedFeeGwei[lastIdx] == null) {
+      latestRequiredFee.textContent = 'n/a';
+      latestChargedFee.textContent = 'n/a';
+      latestGasComponentFee.textContent = 'n/a';
+      latestBlobComponentFee.textContent = 'n/a';
+      latestL2GasUsed.textContent = 'n/a';
+    } else {
+      latestRequiredFee.textContent = formatFeeGwei(derivedRequiredFeeGwei[lastIdx]);
+      latestChargedFee.textContent = formatFeeGwei(derivedChargedFeeGwei[lastIdx]);
+      latestGasComponentFee.textContent = formatFeeGwei(derivedGasFeeComponentGwei[lastIdx]);
+      latestBlobComponentFee.textContent = formatFeeGwei(derivedBlobFeeComponentGwei[lastIdx]);
+      latestL2GasUsed.textContent = `${formatNum(derivedL2GasPerL2Block[lastIdx], 0)} gas/L2 block`;
+    }
+    latestDeficitEth.textContent = `${formatNum(derivedDeficitEth[lastIdx], 6)} ETH`;
+    latestEpsilon.textContent = `${formatNum(derivedEpsilon[lastIdx], 6)}`;
+    latestDerivative.textContent = `${formatNum(derivedDerivative[lastIdx], 6)}`;
+    latestIntegral.textContent = `${formatNum(derivedIntegral[lastIdx], 6)}`;
+    latestFfTerm.textContent = formatFeeGwei(derivedFeedforwardFeeGwei[lastIdx]);
+    latestDTerm.textContent = formatFeeGwei(derivedDTermFeeGwei[lastIdx]);
+    latestFbTerm.textContent = formatFeeGwei(derivedFeedbackFeeGwei[lastIdx]);
+    latestClampState.textContent = derivedClampState[lastIdx];
+    latestVaultValue.textContent = `${formatNum(derivedVaultEth[lastIdx], 6)} ETH`;
+    latestVaultGap.textContent = `${formatNum(derivedVaultEth[lastIdx] - targetVaultEth, 6)} ETH`;
+  }
+
   function recalcDerivedSeries() {
     if (!datasetReady || !blocks.length) {
       setStatus('Loading dataset...');
@@ -2299,7 +2405,8 @@
     derivedL2GasPerProposalText.textContent = `${formatNum(l2GasPerProposalBase, 0)} gas/proposal (base)`;
 
     const n = blocks.length;
-    derivedL2GasPerL1Block = buildL2GasSeries(n, demandScalars.l2GasPerL1BlockTarget, runParams.l2GasScenario);
+    const l2GasBuilder = simCore.createL2GasSeriesBuilder(demandScalars.l2GasPerL1BlockTarget, runParams.l2GasScenario);
+    derivedL2GasPerL1Block = l2GasBuilder.build(n);
     derivedL2GasPerL1BlockBase = new Array(n).fill(demandScalars.l2GasPerL1BlockTarget);
     if (demandScalars.l2BlocksPerL1Block > 0) {
       derivedL2GasPerL2Block = derivedL2GasPerL1Block.map(function (x) {
@@ -2336,7 +2443,9 @@
     derivedVaultEth = new Array(n);
     derivedVaultTargetEth = new Array(n);
 
-    const simulation = simCore.simulateSeries({
+    // Keep the simulator (not just its output) so followed head blocks can
+    // extend this run from its retained state instead of replaying it.
+    const simulator = simCore.createSeriesSimulator({
       ...controllerCfg,
       baseFeeGwei,
       blobFeeGwei,
@@ -2348,6 +2457,15 @@
       blockIndexOffset: 0,
       collectBreakdown: true,
     });
+    simulator.advanceTo(simulator.initialEndIndex);
+    const simulation = simulator.out;
+    liveSimulation = {
+      simulator,
+      l2GasBuilder,
+      l2GasPerL1BlockTarget: demandScalars.l2GasPerL1BlockTarget,
+      l2BlocksPerL1Block: demandScalars.l2BlocksPerL1Block,
+      targetVaultEth,
+    };
 
     derivedGasCostEth = simulation.gasCostEth;
     derivedBlobCostEth = simulation.blobCostEth;
@@ -2373,43 +2491,7 @@
     derivedVaultEth = simulation.vaultEth;
     derivedVaultTargetEth = new Array(n).fill(targetVaultEth);
 
-    const preservedRange = getCurrentXRange();
-
-    if (l2GasPlot && costPlot && proposalPLPlot && requiredFeePlot && chargedFeeOnlyPlot && controllerPlot && feedbackPlot && vaultPlot) {
-      l2GasPlot.setData([blocks, derivedL2GasPerL2Block, derivedL2GasPerL2BlockBase]);
-      costPlot.setData([blocks, derivedGasCostEth, derivedBlobCostEth, derivedPostingCostEth]);
-      const proposalPnLValues = [];
-      for (let i = 0; i < derivedPostingPnLEth.length; i++) {
-        const v = derivedPostingPnLEth[i];
-        if (v != null) proposalPnLValues.push(v);
-      }
-      proposalPLPlot.setData([
-        derivedPostingPnLBlocks,
-        proposalPnLValues,
-        new Array(proposalPnLValues.length).fill(0)
-      ]);
-      controllerPlot.setData([
-        blocks,
-        derivedFeedforwardFeeGwei,
-        derivedPTermFeeGwei,
-        derivedITermFeeGwei,
-        derivedDTermFeeGwei,
-        derivedFeedbackFeeGwei,
-        derivedChargedFeeGwei
-      ]);
-      feedbackPlot.setData([
-        blocks,
-        derivedDeficitEth,
-        derivedEpsilon,
-        derivedDerivative,
-        derivedIntegral
-      ]);
-      refreshComparisonPlots();
-
-      if (preservedRange) {
-        applyRange(preservedRange[0], preservedRange[1], null);
-      }
-    }
+    refreshDerivedPlots(null);
 
     const runRange = currentRangeSnapshot() || { minBlock: MIN_BLOCK, maxBlock: MAX_BLOCK };
     currentRunSnapshot = {
@@ -2424,31 +2506,7 @@
       }
     };
 
-    const lastIdx = n - 1;
-    latestPostingCost.textContent = `${formatNum(derivedPostingCostEth[lastIdx], 6)} ETH`;
-    if (derivedRequiredFeeGwei[lastIdx] == null || derivedChargedFeeGwei[lastIdx] == null) {
-      latestRequiredFee.textContent = 'n/a';
-      latestChargedFee.textContent = 'n/a';
-      latestGasComponentFee.textContent = 'n/a';
-      latestBlobComponentFee.textContent = 'n/a';
-      latestL2GasUsed.textContent = 'n/a';
-    } else {
-      latestRequiredFee.textContent = formatFeeGwei(derivedRequiredFeeGwei[lastIdx]);
-      latestChargedFee.textContent = formatFeeGwei(derivedChargedFeeGwei[lastIdx]);
-      latestGasComponentFee.textContent = formatFeeGwei(derivedGasFeeComponentGwei[lastIdx]);
-      latestBlobComponentFee.textContent = formatFeeGwei(derivedBlobFeeComponentGwei[lastIdx]);
-      latestL2GasUsed.textContent = `${formatNum(derivedL2GasPerL2Block[lastIdx], 0)} gas/L2 block`;
-    }
-    latestDeficitEth.textContent = `${formatNum(derivedDeficitEth[lastIdx], 6)} ETH`;
-    latestEpsilon.textContent = `${formatNum(derivedEpsilon[lastIdx], 6)}`;
-    latestDerivative.textContent = `${formatNum(derivedDerivative[lastIdx], 6)}`;
-    latestIntegral.textContent = `${formatNum(derivedIntegral[lastIdx], 6)}`;
-    latestFfTerm.textContent = formatFeeGwei(derivedFeedforwardFeeGwei[lastIdx]);
-    latestDTerm.textContent = formatFeeGwei(derivedDTermFeeGwei[lastIdx]);
-    latestFbTerm.textContent = formatFeeGwei(derivedFeedbackFeeGwei[lastIdx]);
-    latestClampState.textContent = derivedClampState[lastIdx];
-    latestVaultValue.textContent = `${formatNum(derivedVaultEth[lastIdx], 6)} ETH`;
-    latestVaultGap.textContent = `${formatNum(derivedVaultEth[lastIdx] - targetVaultEth, 6)} ETH`;
+    updateLatestDerivedStats(targetVaultEth);
   }
 
   if (!window.uPlot) {
@@ -2751,7 +2809,7 @@
     };
   }
 
-  function applyRange(minVal, maxVal, sourcePlot) {
+  function applyRange(minVal, maxVal, sourcePlot, rerunSavedRuns = true) {
     if (!datasetReady || !blocks.length) return;
     const prevRange = activeDatasetId && Array.isArray(datasetRangeById[activeDatasetId])
       ? datasetRangeById[activeDatasetId]
@@ -2779,7 +2837,7 @@
         maxBlock: maxB,
       };
     }
-    if (rangeChanged) rerunSavedRunsForCurrentRange();
+    if (rangeChanged && rerunSavedRuns) rerunSavedRunsForCurrentRange();
     refreshRangePresetSelection();
     refreshComparisonPlots();
   }
@@ -3153,6 +3211,164 @@
     });
   });
 
+  function registerFollowDataset(payload) {
+    const id = payload && payload.datasetId ? String(payload.datasetId) : 'live';
+    const payloadBlocks = Array.isArray(payload.blocks) ? payload.blocks : [];
+    const payloadBase = Array.isArray(payload.baseFeeGwei) ? payload.baseFeeGwei : [];
+    const payloadBlob = Array.isArray(payload.blobFeeGwei) ? payload.blobFeeGwei : [];
+    if (!payloadBlocks.length || payloadBase.length !== payloadBlocks.length || payloadBlob.length !== payloadBlocks.length) {
+      throw new Error(`invalid follow snapshot for "${id}"`);
+    }
+    if (!window.__feeDatasetPayloads) window.__feeDatasetPayloads = Object.create(null);
+    window.__feeDatasetPayloads[id] = {
+      blocks: payloadBlocks,
+      baseFeeGwei: payloadBase,
+      blobFeeGwei: payloadBlob,
+      timeAnchor: payload.timeAnchor || null,
+    };
+    if (!DATASET_BY_ID[id]) {
+      const meta = { id, label: `Live head (${id})`, data_js: '' };
+      DATASET_MANIFEST.push(meta);
+      DATASET_BY_ID[id] = meta;
+      setDatasetRangeOptions();
+      if (datasetRangeInput && activeDatasetId) datasetRangeInput.value = activeDatasetId;
+    }
+    followDatasetId = id;
+    return id;
+  }
+
+  // Range to open a follow snapshot at. A fresh page starts on the whole
+  // window; a re-snapshot keeps the view's width pinned to the new head unless
+  // the view had been moved off the previous head. The URL min/max is not
+  // used, since it records a head that has moved on since it was written.
+  function followSnapshotRange(id, prevHead) {
+    const payload = window.__feeDatasetPayloads[id];
+    const first = payload.blocks[0];
+    const head = payload.blocks[payload.blocks.length - 1];
+    const prevRange = datasetReady && activeDatasetId === id ? clampRange(minInput.value, maxInput.value) : null;
+    if (!prevRange) return [first, head];
+    if (Number.isFinite(prevHead) && prevRange[1] < prevHead) return prevRange;
+    return [Math.max(first, head - (prevRange[1] - prevRange[0])), head];
+  }
+
+  function appendFollowedBlocks(payload) {
+    const id = payload && payload.datasetId ? String(payload.datasetId) : '';
+    const target = window.__feeDatasetPayloads && id ? window.__feeDatasetPayloads[id] : null;
+    if (!target || id !== followDatasetId) return 0;
+    const newBlocks = Array.isArray(payload.blocks) ? payload.blocks : [];
+    const newBase = Array.isArray(payload.baseFeeGwei) ? payload.baseFeeGwei : [];
+    const newBlob = Array.isArray(payload.blobFeeGwei) ? payload.blobFeeGwei : [];
+    const prevMaxBlock = target.blocks[target.blocks.length - 1];
+
+    let added = 0;
+    for (let k = 0; k < newBlocks.length; k++) {
+      const b = Number(newBlocks[k]);
+      if (!Number.isFinite(b) || b <= target.blocks[target.blocks.length - 1]) continue;
+      target.blocks.push(b);
+      target.baseFeeGwei.push(Number(newBase[k]) || 0);
+      target.blobFeeGwei.push(Number(newBlob[k]) || 0);
+      added++;
+    }
+    if (payload.timeAnchor) target.timeAnchor = payload.timeAnchor;
+    if (!added || !datasetReady || activeDatasetId !== id || blocks !== target.blocks) return added;
+
+    // The active dataset arrays are the payload arrays, so only the derived
+    // series and the retained simulator need to be advanced here.
+    const prevRange = clampRange(minInput.value, maxInput.value);
+    MAX_BLOCK = blocks[blocks.length - 1];
+    // A view pinned to the previous head slides forward with the new blocks.
+    const shift = MAX_BLOCK - prevMaxBlock;
+    const nextRange = prevRange[1] >= prevMaxBlock
+      ? [prevRange[0] + shift, MAX_BLOCK]
+      : prevRange;
+    if (payload.timeAnchor) applyDatasetTimeAnchor(payload.timeAnchor);
+    if (basePlot) basePlot.setData([blocks, baseFeeGwei]);
+    if (blobPlot) blobPlot.setData([blocks, blobFeeGwei]);
+
+    if (liveSimulation) {
+      const start = derivedL2GasPerL1Block.length;
+      liveSimulation.l2GasBuilder.extend(derivedL2GasPerL1Block, blocks.length - start);
+      const perL2Block = liveSimulation.l2BlocksPerL1Block;
+      const gasTarget = liveSimulation.l2GasPerL1BlockTarget;
+      for (let i = start; i < derivedL2GasPerL1Block.length; i++) {
+        derivedL2GasPerL1BlockBase.push(gasTarget);
+        derivedL2GasPerL2Block.push(perL2Block > 0 ? derivedL2GasPerL1Block[i] / perL2Block : 0);
+        derivedL2GasPerL2BlockBase.push(perL2Block > 0 ? gasTarget / perL2Block : 0);
+        derivedVaultTargetEth.push(liveSimulation.targetVaultEth);
+      }
+      liveSimulation.simulator.advanceTo(blocks.length - 1);
+      if (currentRunSnapshot && currentRunSnapshot.datasetId === id) {
+        for (let i = start; i < blocks.length; i++) {
+          currentRunSnapshot.series.chargedFee.push(derivedChargedFeeGwei[i]);
+          currentRunSnapshot.series.vault.push(derivedVaultEth[i]);
+        }
+        currentRunSnapshot.minBlock = nextRange[0];
+        currentRunSnapshot.maxBlock = nextRange[1];
+      }
+    }
+
+    // Saved runs keep the block range they were replayed over, so an append
+    // only pads their series; replaying them on every slide would cost
+    // window x runs per update. "Recompute saved runs" moves them explicitly.
+    for (const run of savedRunManager.getRuns()) {
+      if (!run || !run.series || run.datasetId !== id) continue;
+      for (const field of ['chargedFee', 'vault']) {
+        const series = run.series[field];
+        if (!Array.isArray(series) || series.length !== blocks.length - added) continue;
+        for (let k = 0; k < added; k++) series.push(null);
+      }
+    }
+
+    refreshDerivedPlots(nextRange, false);
+    if (liveSimulation) updateLatestDerivedStats(liveSimulation.targetVaultEth);
+    return added;
+  }
+
+  function connectFollowStream(streamUrl) {
+    if (typeof window.EventSource !== 'function') {
+      setStatus('Follow mode needs EventSource support in this browser.');
+      return;
+    }
+    const source = new window.EventSource(streamUrl);
+    source.addEventListener('snapshot', function (e) {
+      // Register synchronously so appends that arrive before the deferred
+      // activation land in the snapshot's arrays instead of being dropped.
+      let id;
+      let prevHead = NaN;
+      try {
+        const prevPayload = followDatasetId && window.__feeDatasetPayloads
+          ? window.__feeDatasetPayloads[followDatasetId]
+          : null;
+        if (prevPayload) prevHead = prevPayload.blocks[prevPayload.blocks.length - 1];
+        id = registerFollowDataset(JSON.parse(e.data));
+      } catch (err) {
+        setStatus(`Follow snapshot failed: ${err && err.message ? err.message : err}`);
+        return;
+      }
+      runAsyncUiTask('Loading followed head snapshot...', async function () {
+        try {
+          await activateDataset(id, true, followSnapshotRange(id, prevHead));
+          setStatus(`Following head: block ${MAX_BLOCK.toLocaleString()}`);
+        } catch (err) {
+          setStatus(`Follow snapshot failed: ${err && err.message ? err.message : err}`);
+        }
+      });
+    });
+    source.addEventListener('append', function (e) {
+      try {
+        const added = appendFollowedBlocks(JSON.parse(e.data));
+        if (added && activeDatasetId === followDatasetId) {
+          setStatus(`Following head: block ${MAX_BLOCK.toLocaleString()} (+${added})`);
+        }
+      } catch (err) {
+        setStatus(`Follow update failed: ${err && err.message ? err.message : err}`);
+      }
+    });
+    source.onerror = function () {
+      setStatus('Follow stream disconnected; retrying...');
+    };
+  }
+
   async function initDatasets() {
     setDatasetRangeOptions();
     setRangePresetOptions();
@@ -3176,7 +3392,17 @@
     syncCurrentRunButtonLabel();
     syncFeeMechanismUi();
     syncBlobModeUi();
-    initDatasets();
+    const followStreamUrl = selectedFollowStreamFromQuery();
+    if (followStreamUrl) {
+      // The first snapshot activates the followed dataset, so the default
+      // dataset is not loaded and simulated only to be replaced.
+      setDatasetRangeOptions();
+      setRangePresetOptions();
+      setStatus('Waiting for followed head snapshot...');
+      connectFollowStream(followStreamUrl);
+      return;
+    }
+    await initDatasets();
   }
 
   initApp();
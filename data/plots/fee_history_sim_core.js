@@ -43,13 +43,8 @@
     return Math.max(minBlobs, blobs);
   }
 
-  function buildL2GasSeries(n, baseGasPerL1Block, scenario) {
-    const out = new Array(n);
-    if (scenario === 'constant') {
-      for (let i = 0; i < n; i++) out[i] = baseGasPerL1Block;
-      return out;
-    }
-
+  function createL2GasSeriesBuilder(baseGasPerL1Block, scenario) {
+    const constant = scenario === 'constant';
     const cfg = scenario === 'steady'
       ? { rho: 0.97, sigma: 0.03, jumpProb: 0.0, jumpSigma: 0.0, lo: 0.75, hi: 1.35 }
       : scenario === 'bursty'
@@ -58,134 +53,222 @@
 
     const rng = makeRng(0x1234abcd);
     let x = 0;
-    for (let i = 0; i < n; i++) {
+    // Normalization scale is fixed by the first build() so that extend() can
+    // continue the same demand path without rescaling already-emitted points.
+    let scale = 1;
+
+    function sample() {
       x = cfg.rho * x + cfg.sigma * gaussian(rng);
       if (cfg.jumpProb > 0 && rng() < cfg.jumpProb) x += cfg.jumpSigma * gaussian(rng);
       const m = clampNum(Math.exp(x), cfg.lo, cfg.hi);
-      out[i] = baseGasPerL1Block * m;
+      return baseGasPerL1Block * m;
     }
 
-    let sum = 0;
-    for (let i = 0; i < n; i++) sum += out[i];
-    const avg = n > 0 ? (sum / n) : baseGasPerL1Block;
-    if (avg > 0) {
-      const scale = baseGasPerL1Block / avg;
-      for (let i = 0; i < n; i++) out[i] *= scale;
-    }
-    return out;
-  }
+    function build(n) {
+      const out = new Array(n);
+      if (constant) {
+        for (let i = 0; i < n; i++) out[i] = baseGasPerL1Block;
+        return out;
+      }
+
+      for (let i = 0; i < n; i++) out[i] = sample();
 
-  function createMechanismState(mechanism, cfg) {
-    if (mechanism === 'taiko') {
-      return {
-        integralState: 0,
-        derivFiltered: 0,
-        epsilonPrev: 0,
-      };
+      let sum = 0;
+      for (let i = 0; i < n; i++) sum += out[i];
+      const avg = n > 0 ? (sum / n) : baseGasPerL1Block;
+      if (avg > 0) {
+        scale = baseGasPerL1Block / avg;
+        for (let i = 0; i < n; i++) out[i] *= scale;
+      }
+      return out;
     }
-    if (mechanism === 'arbitrum') {
-      const minFeeGwei = cfg.minFeeWei / 1e9;
-      const maxFeeGwei = cfg.maxFeeWei / 1e9;
-      return {
-        arbPriceGwei: clampNum(cfg.arbInitialPriceGwei, minFeeGwei, maxFeeGwei),
-        arbLastSurplusEth: cfg.initialVaultEth - cfg.targetVaultEth,
-      };
+
+    function extend(series, count) {
+      for (let k = 0; k < count; k++) {
+        series.push(constant ? baseGasPerL1Block : sample() * scale);
+      }
+      return series;
     }
+
     return {
-      eip1559FeeWeiPerL2Gas: cfg.minFeeWei,
+      build,
+      extend,
     };
   }
 
-  function computeFeeForStep(mechanism, state, step, cfg) {
-    if (mechanism === 'taiko') {
-      const gasComponentWei = cfg.alphaGas * (step.baseFeeFfWei + cfg.priorityFeeWei);
-      const blobComponentWei = cfg.alphaBlob * step.blobBaseFeeFfWei;
+  function buildL2GasSeries(n, baseGasPerL1Block, scenario) {
+    return createL2GasSeriesBuilder(baseGasPerL1Block, scenario).build(n);
+  }
+
+  const MECHANISM_CODES = {
+    taiko: 0,
+    arbitrum: 1,
+    eip1559: 2,
+  };
+
+  // Controller parameters and state for one or more normalized configs, held
+  // in typed arrays indexed by config slot m. The series simulator steps a
+  // bank of width 1 and the batch kernel a bank of width M, so the fee rules
+  // below are the only copy.
+  function createControllerBank(simCfgs) {
+    const width = simCfgs.length;
+    const bank = {
+      width,
+      mechanism: new Uint8Array(width),
+      alphaGas: new Float64Array(width),
+      alphaBlob: new Float64Array(width),
+      priorityFeeWei: new Float64Array(width),
+      kp: new Float64Array(width),
+      ki: new Float64Array(width),
+      kd: new Float64Array(width),
+      pTermMinWei: new Float64Array(width),
+      iMin: new Float64Array(width),
+      iMax: new Float64Array(width),
+      derivBeta: new Float64Array(width),
+      minFeeWei: new Float64Array(width),
+      maxFeeWei: new Float64Array(width),
+      feeRangeWei: new Float64Array(width),
+      targetVaultEth: new Float64Array(width),
+      eip1559Denominator: new Float64Array(width),
+      arbInertia: new Float64Array(width),
+      arbEquilUnits: new Float64Array(width),
+      integralState: new Float64Array(width),
+      derivFiltered: new Float64Array(width),
+      epsilonPrev: new Float64Array(width),
+      arbPriceGwei: new Float64Array(width),
+      arbLastSurplusEth: new Float64Array(width),
+      eip1559FeeWei: new Float64Array(width),
+    };
+
+    for (let m = 0; m < width; m++) {
+      const c = simCfgs[m];
+      bank.mechanism[m] = MECHANISM_CODES[c.mechanism];
+      bank.alphaGas[m] = c.alphaGas;
+      bank.alphaBlob[m] = c.alphaBlob;
+      bank.priorityFeeWei[m] = c.priorityFeeWei;
+      bank.kp[m] = c.kp;
+      bank.ki[m] = c.ki;
+      bank.kd[m] = c.kd;
+      bank.pTermMinWei[m] = c.pTermMinWei;
+      bank.iMin[m] = c.iMin;
+      bank.iMax[m] = c.iMax;
+      bank.derivBeta[m] = c.derivBeta;
+      bank.minFeeWei[m] = c.minFeeWei;
+      bank.maxFeeWei[m] = c.maxFeeWei;
+      bank.feeRangeWei[m] = c.feeRangeWei;
+      bank.targetVaultEth[m] = c.targetVaultEth;
+      bank.eip1559Denominator[m] = c.eip1559Denominator;
+      bank.arbInertia[m] = c.arbInertia;
+      bank.arbEquilUnits[m] = c.arbEquilUnits;
+
+      if (c.mechanism === 'arbitrum') {
+        bank.arbPriceGwei[m] = clampNum(c.arbInitialPriceGwei, c.minFeeWei / 1e9, c.maxFeeWei / 1e9);
+        bank.arbLastSurplusEth[m] = c.initialVaultEth - c.targetVaultEth;
+      } else if (c.mechanism === 'eip1559') {
+        bank.eip1559FeeWei[m] = c.minFeeWei;
+      }
+    }
 
-      state.integralState = clampNum(state.integralState + step.epsilon, cfg.iMin, cfg.iMax);
+    return bank;
+  }
 
-      const deRaw = step.localIndex > 0 ? (step.epsilon - state.epsilonPrev) : 0;
-      state.derivFiltered = cfg.derivBeta * state.derivFiltered + (1 - cfg.derivBeta) * deRaw;
-      const pTermWeiRaw = cfg.kp * step.epsilon * cfg.feeRangeWei;
-      const pTermWei = Math.max(cfg.pTermMinWei, pTermWeiRaw);
-      const iTermWei = cfg.ki * state.integralState * cfg.feeRangeWei;
-      const dTermWei = cfg.kd * state.derivFiltered * cfg.feeRangeWei;
+  function clearFeeParts(parts) {
+    parts.gasComponentWei = 0;
+    parts.blobComponentWei = 0;
+    parts.feedforwardWei = 0;
+    parts.pTermWei = 0;
+    parts.iTermWei = 0;
+    parts.dTermWei = 0;
+    parts.feedbackWei = 0;
+    parts.integralState = 0;
+    parts.derivative = 0;
+  }
+
+  // Returns the charged fee (wei per L2 gas) for slot m at this block. When
+  // `parts` is given, the fee breakdown is written into it.
+  function computeControllerFee(bank, m, localIndex, epsilon, baseFeeFfWei, blobBaseFeeFfWei, parts) {
+    const minFeeWei = bank.minFeeWei[m];
+    const maxFeeWei = bank.maxFeeWei[m];
+    const mechanism = bank.mechanism[m];
+
+    if (mechanism === MECHANISM_CODES.taiko) {
+      const gasComponentWei = bank.alphaGas[m] * (baseFeeFfWei + bank.priorityFeeWei[m]);
+      const blobComponentWei = bank.alphaBlob[m] * blobBaseFeeFfWei;
+
+      const integralState = clampNum(bank.integralState[m] + epsilon, bank.iMin[m], bank.iMax[m]);
+      bank.integralState[m] = integralState;
+
+      const deRaw = localIndex > 0 ? (epsilon - bank.epsilonPrev[m]) : 0;
+      const derivBeta = bank.derivBeta[m];
+      const derivFiltered = derivBeta * bank.derivFiltered[m] + (1 - derivBeta) * deRaw;
+      bank.derivFiltered[m] = derivFiltered;
+      bank.epsilonPrev[m] = epsilon;
+
+      const feeRangeWei = bank.feeRangeWei[m];
+      const pTermWeiRaw = bank.kp[m] * epsilon * feeRangeWei;
+      const pTermWei = Math.max(bank.pTermMinWei[m], pTermWeiRaw);
+      const iTermWei = bank.ki[m] * integralState * feeRangeWei;
+      const dTermWei = bank.kd[m] * derivFiltered * feeRangeWei;
       const feedbackWei = pTermWei + iTermWei + dTermWei;
       const feedforwardWei = gasComponentWei + blobComponentWei;
-      const chargedFeeWeiPerL2Gas = clampNum(feedforwardWei + feedbackWei, cfg.minFeeWei, cfg.maxFeeWei);
-
-      return {
-        chargedFeeWeiPerL2Gas,
-        gasComponentWei,
-        blobComponentWei,
-        feedforwardWei,
-        pTermWei,
-        iTermWei,
-        dTermWei,
-        feedbackWei,
-        integralState: state.integralState,
-        derivative: state.derivFiltered,
-      };
+      const chargedFeeWeiPerL2Gas = clampNum(feedforwardWei + feedbackWei, minFeeWei, maxFeeWei);
+
+      if (parts) {
+        parts.gasComponentWei = gasComponentWei;
+        parts.blobComponentWei = blobComponentWei;
+        parts.feedforwardWei = feedforwardWei;
+        parts.pTermWei = pTermWei;
+        parts.iTermWei = iTermWei;
+        parts.dTermWei = dTermWei;
+        parts.feedbackWei = feedbackWei;
+        parts.integralState = integralState;
+        parts.derivative = derivFiltered;
+      }
+      return chargedFeeWeiPerL2Gas;
     }
 
-    if (mechanism === 'arbitrum') {
-      const chargedFeeWeiPerL2Gas = clampNum(state.arbPriceGwei * 1e9, cfg.minFeeWei, cfg.maxFeeWei);
-      return {
-        chargedFeeWeiPerL2Gas,
-        gasComponentWei: 0,
-        blobComponentWei: 0,
-        feedforwardWei: 0,
-        pTermWei: 0,
-        iTermWei: 0,
-        dTermWei: 0,
-        feedbackWei: 0,
-        integralState: 0,
-        derivative: 0,
-      };
+    if (parts) clearFeeParts(parts);
+    if (mechanism === MECHANISM_CODES.arbitrum) {
+      return clampNum(bank.arbPriceGwei[m] * 1e9, minFeeWei, maxFeeWei);
     }
-
-    const chargedFeeWeiPerL2Gas = clampNum(state.eip1559FeeWeiPerL2Gas, cfg.minFeeWei, cfg.maxFeeWei);
-    return {
-      chargedFeeWeiPerL2Gas,
-      gasComponentWei: 0,
-      blobComponentWei: 0,
-      feedforwardWei: 0,
-      pTermWei: 0,
-      iTermWei: 0,
-      dTermWei: 0,
-      feedbackWei: 0,
-      integralState: 0,
-      derivative: 0,
-    };
+    return clampNum(bank.eip1559FeeWei[m], minFeeWei, maxFeeWei);
   }
 
-  function applyPostUpdate(mechanism, state, step, cfg) {
-    if (mechanism === 'arbitrum') {
-      const unitsAllocated = Math.max(0, step.l2GasPerProposal);
-      const surplusEth = step.vault - cfg.targetVaultEth;
-      if (unitsAllocated > 0 && cfg.arbEquilUnits > 0 && cfg.arbInertia > 0) {
-        const inertiaUnits = cfg.arbEquilUnits / cfg.arbInertia;
-        const desiredDerivativeGwei = -(surplusEth * 1e9) / cfg.arbEquilUnits;
-        const actualDerivativeGwei = ((surplusEth - state.arbLastSurplusEth) * 1e9) / unitsAllocated;
+  function applyControllerPostUpdate(bank, m, vault, l2GasPerProposal) {
+    const mechanism = bank.mechanism[m];
+    const targetVaultEth = bank.targetVaultEth[m];
+
+    if (mechanism === MECHANISM_CODES.arbitrum) {
+      const arbEquilUnits = bank.arbEquilUnits[m];
+      const arbInertia = bank.arbInertia[m];
+      const unitsAllocated = Math.max(0, l2GasPerProposal);
+      const surplusEth = vault - targetVaultEth;
+      if (unitsAllocated > 0 && arbEquilUnits > 0 && arbInertia > 0) {
+        const inertiaUnits = arbEquilUnits / arbInertia;
+        const desiredDerivativeGwei = -(surplusEth * 1e9) / arbEquilUnits;
+        const actualDerivativeGwei = ((surplusEth - bank.arbLastSurplusEth[m]) * 1e9) / unitsAllocated;
         const changeDerivativeGwei = desiredDerivativeGwei - actualDerivativeGwei;
         const denom = inertiaUnits + unitsAllocated;
         const priceChangeGwei = denom > 0 ? (changeDerivativeGwei * unitsAllocated) / denom : 0;
-        state.arbPriceGwei = Math.max(0, state.arbPriceGwei + priceChangeGwei);
+        bank.arbPriceGwei[m] = Math.max(0, bank.arbPriceGwei[m] + priceChangeGwei);
       }
-      state.arbLastSurplusEth = surplusEth;
+      bank.arbLastSurplusEth[m] = surplusEth;
       return;
     }
 
-    if (mechanism === 'eip1559') {
-      if (cfg.targetVaultEth > 0) {
-        let errorRatio = (cfg.targetVaultEth - step.vault) / cfg.targetVaultEth;
+    if (mechanism === MECHANISM_CODES.eip1559) {
+      const minFeeWei = bank.minFeeWei[m];
+      const maxFeeWei = bank.maxFeeWei[m];
+      if (targetVaultEth > 0) {
+        let errorRatio = (targetVaultEth - vault) / targetVaultEth;
         errorRatio = clampNum(errorRatio, -8, 1);
-        const adjustmentFactor = 1 + (errorRatio / cfg.eip1559Denominator);
-        const nextFeeWeiPerL2Gas = state.eip1559FeeWeiPerL2Gas * adjustmentFactor;
+        const adjustmentFactor = 1 + (errorRatio / bank.eip1559Denominator[m]);
+        const nextFeeWeiPerL2Gas = bank.eip1559FeeWei[m] * adjustmentFactor;
         if (Number.isFinite(nextFeeWeiPerL2Gas)) {
-          state.eip1559FeeWeiPerL2Gas = clampNum(nextFeeWeiPerL2Gas, cfg.minFeeWei, cfg.maxFeeWei);
+          bank.eip1559FeeWei[m] = clampNum(nextFeeWeiPerL2Gas, minFeeWei, maxFeeWei);
         }
       } else {
-        state.eip1559FeeWeiPerL2Gas = clampNum(state.eip1559FeeWeiPerL2Gas, cfg.minFeeWei, cfg.maxFeeWei);
+        bank.eip1559FeeWei[m] = clampNum(bank.eip1559FeeWei[m], minFeeWei, maxFeeWei);
       }
     }
   }
@@ -196,21 +279,7 @@
     return 'taiko';
   }
 
-  function simulateSeries(rawCfg) {
-    const cfg = Object.assign({}, rawCfg || {});
-    const mechanism = normalizeMechanism(cfg.mechanism);
-    const baseFeeGwei = Array.isArray(cfg.baseFeeGwei) ? cfg.baseFeeGwei : [];
-    const blobFeeGwei = Array.isArray(cfg.blobFeeGwei) ? cfg.blobFeeGwei : [];
-    const l2GasPerL1BlockSeries = Array.isArray(cfg.l2GasPerL1BlockSeries) ? cfg.l2GasPerL1BlockSeries : [];
-    const blocks = Array.isArray(cfg.blocks) ? cfg.blocks : null;
-
-    const seriesLen = Math.min(baseFeeGwei.length, blobFeeGwei.length, l2GasPerL1BlockSeries.length);
-    const fullLength = Math.max(0, Math.min(seriesLen, Math.floor(toNumber(cfg.fullLength, seriesLen))));
-    const rangeStart = clampNum(Math.floor(toNumber(cfg.rangeStart, 0)), 0, Math.max(0, fullLength - 1));
-    const rangeEnd = clampNum(Math.floor(toNumber(cfg.rangeEnd, fullLength - 1)), rangeStart, Math.max(0, fullLength - 1));
-    const blockIndexOffset = Math.floor(toNumber(cfg.blockIndexOffset, 0));
-    const collectBreakdown = cfg.collectBreakdown === true;
-
+  function normalizeControllerConfig(cfg) {
     const postEveryBlocks = Math.max(1, Math.floor(toNumber(cfg.postEveryBlocks, 10)));
     const l1GasUsed = Math.max(0, toNumber(cfg.l1GasUsed, 0));
     const blobMode = cfg.blobMode === 'dynamic' ? 'dynamic' : 'fixed';
@@ -238,7 +307,8 @@
     const arbInertia = Math.max(1, Math.floor(toNumber(cfg.arbInertia, 10)));
     const arbEquilUnits = Math.max(1, toNumber(cfg.arbEquilUnits, 1));
 
-    const simCfg = {
+    return {
+      mechanism: normalizeMechanism(cfg.mechanism),
       alphaGas,
       alphaBlob,
       kp,
@@ -266,11 +336,40 @@
       arbInertia,
       arbEquilUnits,
     };
+  }
+
+  function createSeriesSimulator(rawCfg) {
+    const cfg = Object.assign({}, rawCfg || {});
+    const baseFeeGwei = Array.isArray(cfg.baseFeeGwei) ? cfg.baseFeeGwei : [];
+    const blobFeeGwei = Array.isArray(cfg.blobFeeGwei) ? cfg.blobFeeGwei : [];
+    const l2GasPerL1BlockSeries = Array.isArray(cfg.l2GasPerL1BlockSeries) ? cfg.l2GasPerL1BlockSeries : [];
+    const blocks = Array.isArray(cfg.blocks) ? cfg.blocks : null;
+
+    const seriesLen = Math.min(baseFeeGwei.length, blobFeeGwei.length, l2GasPerL1BlockSeries.length);
+    const fullLength = Math.max(0, Math.min(seriesLen, Math.floor(toNumber(cfg.fullLength, seriesLen))));
+    const rangeStart = clampNum(Math.floor(toNumber(cfg.rangeStart, 0)), 0, Math.max(0, fullLength - 1));
+    const rangeEnd = clampNum(Math.floor(toNumber(cfg.rangeEnd, fullLength - 1)), rangeStart, Math.max(0, fullLength - 1));
+    const blockIndexOffset = Math.floor(toNumber(cfg.blockIndexOffset, 0));
+    const collectBreakdown = cfg.collectBreakdown === true;
+
+    const simCfg = normalizeControllerConfig(cfg);
+    const {
+      postEveryBlocks,
+      l1GasUsed,
+      blobMode,
+      fixedNumBlobs,
+      blobModel,
+      priorityFeeWei,
+      dffBlocks,
+      dfbBlocks,
+      minFeeWei,
+      maxFeeWei,
+      initialVaultEth,
+      targetVaultEth,
+    } = simCfg;
 
     const chargedFeeGwei = new Array(fullLength).fill(null);
     const vaultEth = new Array(fullLength).fill(null);
-    const localN = fullLength > 0 ? (rangeEnd - rangeStart + 1) : 0;
-    const localVaultSeries = new Array(localN).fill(initialVaultEth);
     const out = {
       chargedFeeGwei,
       vaultEth,
@@ -301,10 +400,12 @@
 
     let vault = initialVaultEth;
     let pendingRevenueEth = 0;
-    const mechState = createMechanismState(mechanism, simCfg);
+    const bank = createControllerBank([simCfg]);
+    const feeParts = collectBreakdown ? {} : null;
+    let nextIndex = rangeStart;
 
-    for (let local = 0; local < localN; local++) {
-      const i = rangeStart + local;
+    function step(i) {
+      const local = i - rangeStart;
       const globalIndex = blockIndexOffset + i;
       const baseFeeWei = toNumber(baseFeeGwei[i], 0) * 1e9;
       const blobBaseFeeWei = toNumber(blobFeeGwei[i], 0) * 1e9;
@@ -322,22 +423,13 @@
       const totalCostWei = gasCostWei + blobCostWei;
 
       const fbLocal = local - dfbBlocks;
-      const observedVault = fbLocal >= 0 ? localVaultSeries[fbLocal] : initialVaultEth;
+      const observedVault = fbLocal >= 0 ? vaultEth[rangeStart + fbLocal] : initialVaultEth;
       const deficitEth = targetVaultEth - observedVault;
       const epsilon = targetVaultEth > 0 ? (deficitEth / targetVaultEth) : 0;
 
-      const feeParts = computeFeeForStep(
-        mechanism,
-        mechState,
-        {
-          localIndex: local,
-          epsilon,
-          baseFeeFfWei,
-          blobBaseFeeFfWei,
-        },
-        simCfg
+      const chargedFeeWeiPerL2Gas = computeControllerFee(
+        bank, 0, local, epsilon, baseFeeFfWei, blobBaseFeeFfWei, feeParts
       );
-      const chargedFeeWeiPerL2Gas = feeParts.chargedFeeWeiPerL2Gas;
       chargedFeeGwei[i] = chargedFeeWeiPerL2Gas / 1e9;
 
       const l2RevenueEthPerBlock = (chargedFeeWeiPerL2Gas * l2GasPerL1Block) / 1e18;
@@ -350,15 +442,7 @@
         vault += postingRevenueEth;
         vault -= totalCostWei / 1e18;
 
-        applyPostUpdate(
-          mechanism,
-          mechState,
-          {
-            vault,
-            l2GasPerProposal,
-          },
-          simCfg
-        );
+        applyControllerPostUpdate(bank, 0, vault, l2GasPerProposal);
 
         if (collectBreakdown) {
           out.postingRevenueAtPostEth[i] = postingRevenueEth;
@@ -373,11 +457,6 @@
         out.postBreakEvenFlag[i] = null;
       }
 
-      if (mechanism === 'taiko') {
-        mechState.epsilonPrev = epsilon;
-      }
-
-      localVaultSeries[local] = vault;
       vaultEth[i] = vault;
 
       if (collectBreakdown) {
@@ -404,7 +483,181 @@
       }
     }
 
-    return out;
+    // Steps are strictly sequential, so callers that append to the input
+    // arrays can resume from the retained state instead of replaying.
+    function advanceTo(endIndex) {
+      const inputLen = Math.min(baseFeeGwei.length, blobFeeGwei.length, l2GasPerL1BlockSeries.length);
+      const last = Math.min(Math.floor(toNumber(endIndex, -1)), inputLen - 1);
+      const startIndex = nextIndex;
+      for (let i = startIndex; i <= last; i++) step(i);
+      if (last >= startIndex) nextIndex = last + 1;
+      return nextIndex - startIndex;
+    }
+
+    return {
+      out,
+      advanceTo,
+      nextIndex: function () { return nextIndex; },
+      initialEndIndex: fullLength > 0 ? rangeEnd : rangeStart - 1,
+    };
+  }
+
+  function simulateSeries(rawCfg) {
+    const sim = createSeriesSimulator(rawCfg);
+    sim.advanceTo(sim.initialEndIndex);
+    return sim.out;
+  }
+
+  // Lockstep kernel for several controller configurations over one fee slice.
+  // Fee conversion, demand paths and blob counts are computed once per
+  // distinct input; controllers step through an M-wide controller bank and
+  // outputs are typed arrays laid out block-major (index local * width + m).
+  // Emits charged fee and vault only. Each config may pass its own
+  // l2GasPerL1BlockSeries (indexed like the fee arrays) or
+  // l2GasPerL1BlockTarget + l2GasScenario, which is built over the simulated
+  // range like buildL2GasSeries(rangeLength, ...).
+  function simulateSeriesBatch(rawBatch) {
+    const batch = rawBatch || {};
+    const baseFeeGwei = Array.isArray(batch.baseFeeGwei) ? batch.baseFeeGwei : [];
+    const blobFeeGwei = Array.isArray(batch.blobFeeGwei) ? batch.blobFeeGwei : [];
+    const configs = Array.isArray(batch.configs) ? batch.configs : [];
+    const width = configs.length;
+
+    let seriesLen = Math.min(baseFeeGwei.length, blobFeeGwei.length);
+    for (const c of configs) {
+      if (c && Array.isArray(c.l2GasPerL1BlockSeries)) {
+        seriesLen = Math.min(seriesLen, c.l2GasPerL1BlockSeries.length);
+      }
+    }
+    const fullLength = Math.max(0, Math.min(seriesLen, Math.floor(toNumber(batch.fullLength, seriesLen))));
+    const rangeStart = clampNum(Math.floor(toNumber(batch.rangeStart, 0)), 0, Math.max(0, fullLength - 1));
+    const rangeEnd = clampNum(Math.floor(toNumber(batch.rangeEnd, fullLength - 1)), rangeStart, Math.max(0, fullLength - 1));
+    const blockIndexOffset = Math.floor(toNumber(batch.blockIndexOffset, 0));
+    const localN = fullLength > 0 ? (rangeEnd - rangeStart + 1) : 0;
+
+    const baseFeeWei = new Float64Array(localN);
+    const blobBaseFeeWei = new Float64Array(localN);
+    for (let local = 0; local < localN; local++) {
+      baseFeeWei[local] = toNumber(baseFeeGwei[rangeStart + local], 0) * 1e9;
+      blobBaseFeeWei[local] = toNumber(blobFeeGwei[rangeStart + local], 0) * 1e9;
+    }
+
+    const simCfgs = new Array(width);
+    const postEvery = new Int32Array(width);
+    const dff = new Int32Array(width);
+    const dfb = new Int32Array(width);
+    const l1GasUsed = new Float64Array(width);
+    const initialVaultEth = new Float64Array(width);
+    const vault = new Float64Array(width);
+    const pendingRevenueEth = new Float64Array(width);
+
+    const demandIndexByKey = new Map();
+    const demandSeries = [];
+    const demandOf = new Int32Array(width);
+    const costIndexByKey = new Map();
+    const costGroups = [];
+    const costOf = new Int32Array(width);
+
+    for (let m = 0; m < width; m++) {
+      const raw = configs[m] || {};
+      const c = normalizeControllerConfig(raw);
+
+      const explicitDemand = Array.isArray(raw.l2GasPerL1BlockSeries);
+      const demandKey = explicitDemand
+        ? raw.l2GasPerL1BlockSeries
+        : `${toNumber(raw.l2GasPerL1BlockTarget, 0)}|${raw.l2GasScenario}`;
+      if (!demandIndexByKey.has(demandKey)) {
+        const src = explicitDemand
+          ? raw.l2GasPerL1BlockSeries
+          : buildL2GasSeries(localN, toNumber(raw.l2GasPerL1BlockTarget, 0), raw.l2GasScenario);
+        const srcOffset = explicitDemand ? rangeStart : 0;
+        const series = new Float64Array(localN);
+        for (let local = 0; local < localN; local++) {
+          series[local] = Math.max(0, toNumber(src[srcOffset + local], 0));
+        }
+        demandIndexByKey.set(demandKey, demandSeries.length);
+        demandSeries.push(series);
+      }
+      demandOf[m] = demandIndexByKey.get(demandKey);
+
+      const blobKey = c.blobMode === 'dynamic' ? JSON.stringify(c.blobModel) : String(c.fixedNumBlobs);
+      const costKey = `${demandOf[m]}|${c.postEveryBlocks}|${c.blobMode}|${blobKey}`;
+      if (!costIndexByKey.has(costKey)) {
+        costIndexByKey.set(costKey, costGroups.length);
+        costGroups.push({
+          demand: demandSeries[demandOf[m]],
+          postEveryBlocks: c.postEveryBlocks,
+          dynamic: c.blobMode === 'dynamic',
+          fixedNumBlobs: c.fixedNumBlobs,
+          blobModel: c.blobModel,
+        });
+      }
+      costOf[m] = costIndexByKey.get(costKey);
+
+      simCfgs[m] = c;
+      postEvery[m] = c.postEveryBlocks;
+      dff[m] = c.dffBlocks;
+      dfb[m] = c.dfbBlocks;
+      l1GasUsed[m] = c.l1GasUsed;
+      initialVaultEth[m] = c.initialVaultEth;
+      vault[m] = c.initialVaultEth;
+    }
+
+    const bank = createControllerBank(simCfgs);
+    const chargedFeeGwei = new Float64Array(localN * width);
+    const vaultEth = new Float64Array(localN * width);
+    const blobCostWeiByGroup = new Float64Array(costGroups.length);
+
+    for (let local = 0; local < localN; local++) {
+      const globalIndex = blockIndexOffset + rangeStart + local;
+      const row = local * width;
+      const blockBaseFeeWei = baseFeeWei[local];
+
+      for (let g = 0; g < costGroups.length; g++) {
+        const group = costGroups[g];
+        const numBlobs = group.dynamic
+          ? estimateDynamicBlobs(group.demand[local] * group.postEveryBlocks, group.blobModel)
+          : group.fixedNumBlobs;
+        blobCostWeiByGroup[g] = numBlobs * BLOB_GAS_PER_BLOB * blobBaseFeeWei[local];
+      }
+
+      for (let m = 0; m < width; m++) {
+        const l2GasPerL1Block = demandSeries[demandOf[m]][local];
+        const l2GasPerProposal = l2GasPerL1Block * postEvery[m];
+        const gasCostWei = l1GasUsed[m] * (blockBaseFeeWei + bank.priorityFeeWei[m]);
+        const totalCostWei = gasCostWei + blobCostWeiByGroup[costOf[m]];
+
+        const fbLocal = local - dfb[m];
+        const observedVault = fbLocal >= 0 ? vaultEth[fbLocal * width + m] : initialVaultEth[m];
+        const targetEth = bank.targetVaultEth[m];
+        const deficitEth = targetEth - observedVault;
+        const epsilon = targetEth > 0 ? (deficitEth / targetEth) : 0;
+
+        const ffLocal = Math.max(0, local - dff[m]);
+        const chargedFeeWeiPerL2Gas = computeControllerFee(
+          bank, m, local, epsilon, baseFeeWei[ffLocal], blobBaseFeeWei[ffLocal], null
+        );
+        chargedFeeGwei[row + m] = chargedFeeWeiPerL2Gas / 1e9;
+        pendingRevenueEth[m] += (chargedFeeWeiPerL2Gas * l2GasPerL1Block) / 1e18;
+
+        if (((globalIndex + 1) % postEvery[m]) === 0) {
+          vault[m] += pendingRevenueEth[m];
+          pendingRevenueEth[m] = 0;
+          vault[m] -= totalCostWei / 1e18;
+          applyControllerPostUpdate(bank, m, vault[m], l2GasPerProposal);
+        }
+
+        vaultEth[row + m] = vault[m];
+      }
+    }
+
+    return {
+      width,
+      length: localN,
+      rangeStart,
+      chargedFeeGwei,
+      vaultEth,
+    };
   }
 
   window.FeeSimCore = {
@@ -414,6 +667,9 @@
     clampNum,
     estimateDynamicBlobs,
     buildL2GasSeries,
+    createL2GasSeriesBuilder,
     simulateSeries,
+    createSeriesSimulator,
+    simulateSeriesBatch,
   };
 })();
@@ -204,3 +204,125 @@ test('sliced replay configuration matches full-array ranged simulation', () => {
   assert.deepEqual(replay.chargedFeeGwei, rangedChargedSlice);
   assert.deepEqual(replay.vaultEth, rangedVaultSlice);
 });
+
+test('createL2GasSeriesBuilder extends the demand path without rescaling emitted points', () => {
+  const sim = loadSimCore();
+  const builder = sim.createL2GasSeriesBuilder(42000, 'bursty');
+  const series = builder.build(96);
+  assert.deepEqual(series, sim.buildL2GasSeries(96, 42000, 'bursty'));
+
+  const prefix = series.slice();
+  builder.extend(series, 32);
+  assert.equal(series.length, 128);
+  assert.deepEqual(series.slice(0, 96), prefix);
+  for (let i = 96; i < series.length; i++) {
+    assert.ok(Number.isFinite(series[i]) && series[i] > 0, `extended demand[${i}] must be positive`);
+  }
+
+  const again = sim.createL2GasSeriesBuilder(42000, 'bursty');
+  assert.deepEqual(again.extend(again.build(96), 32), series);
+
+  const constant = sim.createL2GasSeriesBuilder(777, 'constant');
+  const constantSeries = constant.extend(constant.build(4), 3);
+  assert.deepEqual(constantSeries, [777, 777, 777, 777, 777, 777, 777]);
+});
+
+test('series simulator resumed over appended blocks matches a full simulation', () => {
+  const sim = loadSimCore();
+  for (const mechanism of ['taiko', 'arbitrum', 'eip1559']) {
+    const n = 24;
+    const head = 11;
+    const fullCfg = baseConfigForMechanism(mechanism);
+    fullCfg.fullLength = n;
+    fullCfg.rangeEnd = n - 1;
+    fullCfg.postEveryBlocks = 3;
+    fullCfg.blocks = Array.from({ length: n }, (_, i) => 1000 + i);
+    fullCfg.baseFeeGwei = Array.from({ length: n }, (_, i) => 1 + (i % 7) * 0.2);
+    fullCfg.blobFeeGwei = Array.from({ length: n }, (_, i) => 2 + (i % 5) * 0.15);
+    fullCfg.l2GasPerL1BlockSeries = Array.from({ length: n }, (_, i) => 100000 + (i % 3) * 5000);
+    const full = sim.simulateSeries(fullCfg);
+
+    const liveCfg = {
+      ...fullCfg,
+      blocks: fullCfg.blocks.slice(0, head),
+      baseFeeGwei: fullCfg.baseFeeGwei.slice(0, head),
+      blobFeeGwei: fullCfg.blobFeeGwei.slice(0, head),
+      l2GasPerL1BlockSeries: fullCfg.l2GasPerL1BlockSeries.slice(0, head),
+      fullLength: head,
+      rangeEnd: head - 1,
+    };
+    const live = sim.createSeriesSimulator(liveCfg);
+    assert.equal(live.advanceTo(live.initialEndIndex), head);
+    for (let i = head; i < n; i += 5) {
+      const end = Math.min(n, i + 5);
+      for (let j = i; j < end; j++) {
+        liveCfg.blocks.push(fullCfg.blocks[j]);
+        liveCfg.baseFeeGwei.push(fullCfg.baseFeeGwei[j]);
+        liveCfg.blobFeeGwei.push(fullCfg.blobFeeGwei[j]);
+        liveCfg.l2GasPerL1BlockSeries.push(fullCfg.l2GasPerL1BlockSeries[j]);
+      }
+      assert.equal(live.advanceTo(end - 1), end - i);
+    }
+    assert.equal(live.nextIndex(), n);
+    assert.equal(live.advanceTo(n + 10), 0, 'advancing past the appended inputs must be a no-op');
+
+    for (const key of Object.keys(full)) {
+      assert.deepEqual(live.out[key], full[key], `${mechanism} ${key} diverged after incremental append`);
+    }
+  }
+});
+
+test('simulateSeriesBatch advances mixed configurations in lockstep like separate simulations', () => {
+  const sim = loadSimCore();
+  const n = 40;
+  const i0 = 5;
+  const i1 = 33;
+  const { baseFeeGwei: _base, blobFeeGwei: _blob, l2GasPerL1BlockSeries: _gas, ...shared } = baseConfigForMechanism('taiko');
+  shared.collectBreakdown = false;
+  const baseFeeGwei = Array.from({ length: n }, (_, i) => 1 + (i % 7) * 0.2);
+  const blobFeeGwei = Array.from({ length: n }, (_, i) => 2 + (i % 5) * 0.15);
+  const explicitGas = Array.from({ length: n }, (_, i) => 100000 + (i % 3) * 5000);
+
+  const configs = [
+    { ...shared, mechanism: 'taiko', l2GasPerL1BlockSeries: explicitGas },
+    { ...shared, mechanism: 'taiko', kd: 0.3, blobMode: 'dynamic', l2GasPerL1BlockTarget: 140000, l2GasScenario: 'bursty' },
+    { ...shared, mechanism: 'arbitrum', postEveryBlocks: 1, initialVaultEth: 2, l2GasPerL1BlockSeries: explicitGas },
+    { ...shared, mechanism: 'eip1559', postEveryBlocks: 3, initialVaultEth: 4, l2GasPerL1BlockTarget: 140000, l2GasScenario: 'bursty' },
+    { ...shared, mechanism: 'eip1559', dfbBlocks: 4, blobMode: 'dynamic', l2GasPerL1BlockTarget: 90000, l2GasScenario: 'steady' },
+  ];
+
+  const out = sim.simulateSeriesBatch({
+    baseFeeGwei,
+    blobFeeGwei,
+    fullLength: n,
+    rangeStart: i0,
+    rangeEnd: i1,
+    blockIndexOffset: 0,
+    configs,
+  });
+  assert.equal(out.width, configs.length);
+  assert.equal(out.length, i1 - i0 + 1);
+  assert.equal(out.rangeStart, i0);
+
+  configs.forEach((cfg, m) => {
+    const gasSeries = cfg.l2GasPerL1BlockSeries
+      || [
+        ...new Array(i0).fill(0),
+        ...sim.buildL2GasSeries(i1 - i0 + 1, cfg.l2GasPerL1BlockTarget, cfg.l2GasScenario),
+      ];
+    const single = sim.simulateSeries({
+      ...cfg,
+      baseFeeGwei,
+      blobFeeGwei,
+      l2GasPerL1BlockSeries: gasSeries,
+      fullLength: i1 + 1,
+      rangeStart: i0,
+      rangeEnd: i1,
+    });
+    for (let local = 0; local < out.length; local++) {
+      const at = local * out.width + m;
+      assert.equal(out.chargedFeeGwei[at], single.chargedFeeGwei[i0 + local], `config ${m} chargedFee[${local}]`);
+      assert.equal(out.vaultEth[at], single.vaultEth[i0 + local], `config ${m} vault[${local}]`);
+    }
+  });
+});
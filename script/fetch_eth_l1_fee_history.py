@@ -11,6 +11,13 @@ from datetime import datetime, timezone
 
 import requests
 
+FEE_CSV_FIELDS = [
+    "block_number",
+    "base_fee_per_gas_wei",
+    "base_fee_per_blob_gas_wei",
+    "blob_gas_used_ratio",
+]
+
 
 def pct(arr, p):
     s = sorted(arr)
@@ -76,6 +83,45 @@ def make_rpc(session, rpc_url):
     return rpc
 
 
+def fetch_fee_rows(rpc, start_block, end_block, chunk, progress=False):
+    total_blocks = end_block - start_block + 1
+    expected_calls = (total_blocks + chunk - 1) // chunk
+    rows = []
+    current_newest = end_block
+    calls = 0
+
+    while current_newest >= start_block:
+        n = min(chunk, current_newest - start_block + 1)
+        res = rpc("eth_feeHistory", [hex(n), hex(current_newest), []], rid=2)
+
+        oldest = int(res["oldestBlock"], 16)
+        bf = res.get("baseFeePerGas", [])
+        bbf = res.get("baseFeePerBlobGas", [])
+        bur = res.get("blobGasUsedRatio", [])
+
+        if len(bf) < n:
+            raise RuntimeError(f"Unexpected baseFeePerGas length {len(bf)} for n={n}")
+
+        for i in range(n):
+            block_number = oldest + i
+            rows.append(
+                {
+                    "block_number": block_number,
+                    "base_fee_per_gas_wei": int(bf[i], 16),
+                    "base_fee_per_blob_gas_wei": int(bbf[i], 16) if i < len(bbf) else 0,
+                    "blob_gas_used_ratio": float(bur[i]) if i < len(bur) else 0.0,
+                }
+            )
+
+        current_newest = oldest - 1
+        calls += 1
+        if progress and (calls % 20 == 0 or current_newest < start_block):
+            print(f"Progress calls={calls}/{expected_calls} blocks={len(rows)}/{total_blocks}")
+
+    rows.sort(key=lambda x: x["block_number"])
+    return rows
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch Ethereum L1 fee history and export CSV+summary")
     parser.add_argument("--days", type=int, default=365, help="Number of days to fetch (default: 365)")
@@ -149,39 +195,7 @@ def main():
     else:
         print(f"Collecting explicit block range {start_block}..{latest} ({total_blocks} blocks), expected_calls={expected_calls}")
 
-    rows = []
-    current_newest = latest
-    calls = 0
-
-    while current_newest >= start_block:
-        n = min(args.chunk, current_newest - start_block + 1)
-        res = rpc("eth_feeHistory", [hex(n), hex(current_newest), []], rid=2)
-
-        oldest = int(res["oldestBlock"], 16)
-        bf = res.get("baseFeePerGas", [])
-        bbf = res.get("baseFeePerBlobGas", [])
-        bur = res.get("blobGasUsedRatio", [])
-
-        if len(bf) < n:
-            raise RuntimeError(f"Unexpected baseFeePerGas length {len(bf)} for n={n}")
-
-        for i in range(n):
-            block_number = oldest + i
-            rows.append(
-                {
-                    "block_number": block_number,
-                    "base_fee_per_gas_wei": int(bf[i], 16),
-                    "base_fee_per_blob_gas_wei": int(bbf[i], 16) if i < len(bbf) else 0,
-                    "blob_gas_used_ratio": float(bur[i]) if i < len(bur) else 0.0,
-                }
-            )
-
-        current_newest = oldest - 1
-        calls += 1
-        if calls % 20 == 0 or current_newest < start_block:
-            print(f"Progress calls={calls}/{expected_calls} blocks={len(rows)}/{total_blocks}")
-
-    rows.sort(key=lambda x: x["block_number"])
+    rows = fetch_fee_rows(rpc, start_block, latest, args.chunk, progress=True)
 
     base = [r["base_fee_per_gas_wei"] for r in rows]
     blob = [r["base_fee_per_blob_gas_wei"] for r in rows]
@@ -251,15 +265,7 @@ def main():
     json_path = os.path.join(out_dir, base_name + "_summary.json")
 
     with open(csv_path, "w", newline="") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=[
-                "block_number",
-                "base_fee_per_gas_wei",
-                "base_fee_per_blob_gas_wei",
-                "blob_gas_used_ratio",
-            ],
-        )
+        w = csv.DictWriter(f, fieldnames=FEE_CSV_FIELDS)
         w.writeheader()
         w.writerows(rows)
 
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+
+"""Follow the Ethereum L1 head and stream new fee blocks to the interactive simulator.
+
+New blocks are fetched with the same eth_feeHistory path as
+fetch_eth_l1_fee_history.py, appended to a fee CSV store, and pushed to open
+simulator pages over Server-Sent Events. The script also serves data/plots/, so
+the page can be opened from the same origin with ``?follow=1``.
+"""
+
+import argparse
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+from fetch_eth_l1_fee_history import FEE_CSV_FIELDS, fetch_fee_rows, make_rpc
+
+EVENTS_PATH = "/follow/events"
+L1_BLOCK_TIME_SECONDS = 12
+KEEPALIVE_SECONDS = 15
+
+
+def read_store_tail(csv_path, window_blocks):
+    rows = deque(maxlen=window_blocks)
+    if not os.path.exists(csv_path):
+        return rows
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            block = int(row["block_number"])
+            # Skip repeated or out-of-order blocks so a damaged store can't
+            # hand the page a non-increasing series.
+            if rows and block <= rows[-1]["block_number"]:
+                continue
+            rows.append(
+                {
+                    "block_number": block,
+                    "base_fee_per_gas_wei": int(row["base_fee_per_gas_wei"]),
+                    "base_fee_per_blob_gas_wei": int(row["base_fee_per_blob_gas_wei"]),
+                    "blob_gas_used_ratio": float(row["blob_gas_used_ratio"]),
+                }
+            )
+    return rows
+
+
+def append_store_rows(csv_path, rows):
+    write_header = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+    with open(csv_path, "a", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=FEE_CSV_FIELDS)
+        if write_header:
+            w.writeheader()
+        w.writerows(rows)
+
+
+class FeeFollower:
+    """Retained tail of the fee store, shared between the poller and stream clients."""
+
+    def __init__(self, dataset_id, rows):
+        self.dataset_id = dataset_id
+        self.rows = rows
+        self.time_anchor = None
+        self.cond = threading.Condition()
+
+    def last_block(self):
+        with self.cond:
+            return self.rows[-1]["block_number"] if self.rows else None
+
+    def extend(self, rows, time_anchor):
+        with self.cond:
+            self.rows.extend(rows)
+            self.time_anchor = time_anchor
+            self.cond.notify_all()
+
+    def rows_after(self, block):
+        # None means the client has nothing usable (or fell behind the retained
+        # window) and needs a full snapshot; otherwise only the newer rows.
+        with self.cond:
+            if not self.rows:
+                return []
+            if block is None or block < self.rows[0]["block_number"] - 1:
+                return None
+            out = []
+            for row in reversed(self.rows):
+                if row["block_number"] <= block:
+                    break
+                out.append(row)
+            out.reverse()
+            return out
+
+    def snapshot_rows(self):
+        with self.cond:
+            return list(self.rows)
+
+    def wait_for_blocks_after(self, block, timeout):
+        with self.cond:
+            self.cond.wait_for(
+                lambda: self.rows and (block is None or self.rows[-1]["block_number"] > block),
+                timeout=timeout,
+            )
+
+    def payload(self, rows):
+        return {
+            "datasetId": self.dataset_id,
+            "blocks": [r["block_number"] for r in rows],
+            "baseFeeGwei": [r["base_fee_per_gas_wei"] / 1e9 for r in rows],
+            "blobFeeGwei": [r["base_fee_per_blob_gas_wei"] / 1e9 for r in rows],
+            "timeAnchor": self.time_anchor,
+        }
+
+
+def poll_once(rpc, follower, args):
+    head = int(rpc("eth_blockNumber", []), 16) - args.confirmations
+    last = follower.last_block()
+    start = max(0, head - args.window_blocks + 1) if last is None else last + 1
+    if head < start:
+        return []
+    # Resolve the time anchor before touching the store: the CSV write and
+    # follower.extend happen together, so a failed poll leaves last_block()
+    # and the store in step and is simply retried.
+    head_blk = rpc("eth_getBlockByNumber", [hex(head), False], rid=3)
+    if not head_blk:
+        raise RuntimeError(f"Block {head} not available yet")
+    time_anchor = {
+        "has_anchor": True,
+        "anchor_block": head,
+        "anchor_ts_sec": int(head_blk["timestamp"], 16),
+        "seconds_per_block": float(L1_BLOCK_TIME_SECONDS),
+        "source": "follow_head_anchor",
+    }
+    rows = fetch_fee_rows(rpc, start, head, args.chunk)
+    if last is not None:
+        rows = [r for r in rows if r["block_number"] > last]
+    append_store_rows(args.csv, rows)
+    follower.extend(rows, time_anchor)
+    print(f"Appended blocks {start}..{head} ({len(rows)} rows) to {args.csv}")
+    return rows
+
+
+def poll_head(rpc, follower, args):
+    while True:
+        try:
+            poll_once(rpc, follower, args)
+        except Exception as e:
+            print(f"Head poll failed: {e}")
+        time.sleep(args.poll_seconds)
+
+
+class FollowRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, follower, **kwargs):
+        self.follower = follower
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        if urlsplit(self.path).path != EVENTS_PATH:
+            super().do_GET()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            self.stream_events()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def write_event(self, name, payload):
+        data = json.dumps(payload, separators=(",", ":"))
+        self.wfile.write(f"event: {name}\nid: {payload['blocks'][-1]}\ndata: {data}\n\n".encode())
+        self.wfile.flush()
+
+    def stream_events(self):
+        # EventSource resends the last event id (a block number) on reconnect,
+        # so a reconnecting page only receives the blocks it missed.
+        raw_last_id = self.headers.get("Last-Event-ID")
+        try:
+            after = int(raw_last_id) if raw_last_id else None
+        except ValueError:
+            after = None
+        while True:
+            rows = self.follower.rows_after(after)
+            if rows is None:
+                rows = self.follower.snapshot_rows()
+                self.write_event("snapshot", self.follower.payload(rows))
+                after = rows[-1]["block_number"]
+            elif rows:
+                self.write_event("append", self.follower.payload(rows))
+                after = rows[-1]["block_number"]
+            else:
+                self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+            self.follower.wait_for_blocks_after(after, KEEPALIVE_SECONDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Follow the L1 head, append fee blocks to a CSV store and stream them to the simulator page"
+    )
+    parser.add_argument(
+        "--rpc",
+        default="https://ethereum-rpc.publicnode.com",
+        help="Ethereum JSON-RPC endpoint (a local node or stand-in works too)",
+    )
+    parser.add_argument(
+        "--csv",
+        default=os.path.join(os.path.dirname(__file__), "..", "data", "eth_l1_fee_follow.csv"),
+        help="Fee CSV store to append to (created if missing; resumes after its last block)",
+    )
+    parser.add_argument("--dataset-id", default="live", help="Dataset id the page shows the followed blocks under")
+    parser.add_argument(
+        "--window-blocks",
+        type=int,
+        default=7200,
+        help="Blocks kept in memory for page snapshots, and backfilled when the store is empty",
+    )
+    parser.add_argument("--poll-seconds", type=float, default=L1_BLOCK_TIME_SECONDS, help="Head poll interval")
+    parser.add_argument("--confirmations", type=int, default=2, help="Stay this many blocks behind the head")
+    parser.add_argument("--chunk", type=int, default=1024, help="feeHistory blockCount per RPC call")
+    parser.add_argument(
+        "--serve-dir",
+        default=os.path.join(os.path.dirname(__file__), "..", "data", "plots"),
+        help="Directory with the interactive simulator page",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address for the local server")
+    parser.add_argument("--port", type=int, default=8000, help="Port for the local server")
+    args = parser.parse_args()
+
+    if args.window_blocks <= 0:
+        raise ValueError("--window-blocks must be positive")
+    args.csv = os.path.abspath(args.csv)
+    os.makedirs(os.path.dirname(args.csv), exist_ok=True)
+
+    follower = FeeFollower(args.dataset_id, read_store_tail(args.csv, args.window_blocks))
+    last = follower.last_block()
+    if last is not None:
+        print(f"Resuming {args.csv} after block {last}")
+
+    session = requests.Session()
+    rpc = make_rpc(session, args.rpc)
+    threading.Thread(target=poll_head, args=(rpc, follower, args), daemon=True).start()
+
+    handler = partial(FollowRequestHandler, directory=os.path.abspath(args.serve_dir), follower=follower)
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    print(f"Serving http://{args.host}:{args.port}/fee_history_interactive.html?follow=1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,9 @@ python3 script/generate_interactive_fee_uplot.py \
   --out-js data/plots/fee_history_interactive_app.js \
   --out-manifest-js data/plots/fee_history_interactive_manifest.js
 
-echo "[pipeline] Step 2/3: run simulation core tests"
+echo "[pipeline] Step 2/3: run simulation core and follower script tests"
 node --test data/plots/tests/*.test.js
+python3 -m unittest discover -s script/tests
 
 echo "[pipeline] Step 3/3: run Playwright visual regression tests"
 npm run visual:test
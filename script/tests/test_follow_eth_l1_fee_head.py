@@ -0,0 +1,182 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.request
+from collections import deque
+from functools import partial
+from http.server import ThreadingHTTPServer
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from follow_eth_l1_fee_head import (  # noqa: E402
+    EVENTS_PATH,
+    FeeFollower,
+    FollowRequestHandler,
+    append_store_rows,
+    poll_once,
+    read_store_tail,
+)
+
+
+class StubRpc:
+    """Chain stand-in whose base fee at block b is b gwei."""
+
+    def __init__(self, head):
+        self.head = head
+        self.block_failures = []
+
+    def __call__(self, method, params, rid=1):
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getBlockByNumber":
+            if self.block_failures:
+                failure = self.block_failures.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            return {"timestamp": hex(1_700_000_000 + int(params[0], 16) * 12)}
+        if method == "eth_feeHistory":
+            n = int(params[0], 16)
+            oldest = int(params[1], 16) - n + 1
+            return {
+                "oldestBlock": hex(oldest),
+                "baseFeePerGas": [hex(b * 10**9) for b in range(oldest, oldest + n + 1)],
+                "baseFeePerBlobGas": [hex(1) for _ in range(n + 1)],
+                "blobGasUsedRatio": [0.5] * n,
+            }
+        raise AssertionError(f"unexpected method {method}")
+
+
+def stored_blocks(csv_path):
+    with open(csv_path) as f:
+        return [int(line.split(",")[0]) for line in f.read().splitlines()[1:]]
+
+
+def row(block):
+    return {
+        "block_number": block,
+        "base_fee_per_gas_wei": block * 10**9,
+        "base_fee_per_blob_gas_wei": 1,
+        "blob_gas_used_ratio": 0.5,
+    }
+
+
+class FollowStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_path = os.path.join(tmp.name, "follow.csv")
+        self.args = SimpleNamespace(csv=self.csv_path, confirmations=2, window_blocks=5, chunk=3)
+
+    def poll(self, rpc, follower):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return poll_once(rpc, follower, self.args)
+
+    def test_backfills_window_then_appends_only_new_blocks(self):
+        rpc = StubRpc(head=110)
+        follower = FeeFollower("live", read_store_tail(self.csv_path, self.args.window_blocks))
+        self.poll(rpc, follower)
+        self.assertEqual(stored_blocks(self.csv_path), [104, 105, 106, 107, 108])
+
+        self.assertEqual(self.poll(rpc, follower), [])
+        rpc.head = 113
+        self.poll(rpc, follower)
+        self.assertEqual(stored_blocks(self.csv_path), list(range(104, 112)))
+        self.assertEqual([r["block_number"] for r in follower.snapshot_rows()], list(range(107, 112)))
+        self.assertEqual(follower.time_anchor["anchor_block"], 111)
+
+    def test_failed_time_anchor_leaves_store_untouched_and_retry_writes_once(self):
+        rpc = StubRpc(head=110)
+        follower = FeeFollower("live", read_store_tail(self.csv_path, self.args.window_blocks))
+        self.poll(rpc, follower)
+
+        rpc.head = 114
+        rpc.block_failures = [RuntimeError("rpc down"), None]
+        with self.assertRaises(RuntimeError):
+            self.poll(rpc, follower)
+        with self.assertRaises(RuntimeError):
+            self.poll(rpc, follower)
+        self.assertEqual(stored_blocks(self.csv_path), list(range(104, 109)))
+        self.assertEqual(follower.last_block(), 108)
+
+        self.poll(rpc, follower)
+        self.assertEqual(stored_blocks(self.csv_path), list(range(104, 113)))
+
+    def test_restart_resumes_after_last_stored_block(self):
+        rpc = StubRpc(head=110)
+        self.poll(rpc, FeeFollower("live", read_store_tail(self.csv_path, self.args.window_blocks)))
+
+        rpc.head = 112
+        restarted = FeeFollower("live", read_store_tail(self.csv_path, self.args.window_blocks))
+        self.assertEqual(restarted.last_block(), 108)
+        self.poll(rpc, restarted)
+        self.assertEqual(stored_blocks(self.csv_path), list(range(104, 111)))
+
+    def test_read_store_tail_skips_repeated_and_out_of_order_blocks(self):
+        append_store_rows(self.csv_path, [row(b) for b in (104, 105, 106, 104, 105, 106, 107, 103, 108)])
+        tail = read_store_tail(self.csv_path, 4)
+        self.assertEqual([r["block_number"] for r in tail], [105, 106, 107, 108])
+
+
+class QuietFollowRequestHandler(FollowRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class FollowStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.follower = FeeFollower("live", deque(maxlen=5))
+        self.follower.extend([row(b) for b in range(104, 109)], {"has_anchor": False})
+
+    def test_rows_after_window_boundary(self):
+        def blocks_after(block):
+            return [r["block_number"] for r in self.follower.rows_after(block)]
+
+        self.assertIsNone(self.follower.rows_after(None))
+        self.assertIsNone(self.follower.rows_after(102))
+        self.assertEqual(blocks_after(103), [104, 105, 106, 107, 108])
+        self.assertEqual(blocks_after(106), [107, 108])
+        self.assertEqual(blocks_after(108), [])
+
+    def first_event(self, last_event_id):
+        handler = partial(QuietFollowRequestHandler, directory=os.devnull, follower=self.follower)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        req = urllib.request.Request(f"http://127.0.0.1:{server.server_port}{EVENTS_PATH}")
+        if last_event_id is not None:
+            req.add_header("Last-Event-ID", str(last_event_id))
+        fields = {}
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            for raw in resp:
+                line = raw.decode().rstrip("\n")
+                if not line:
+                    break
+                key, _, value = line.partition(": ")
+                fields[key] = value
+        return fields["event"], fields["id"], json.loads(fields["data"])
+
+    def test_reconnect_inside_window_gets_only_missed_blocks(self):
+        name, event_id, data = self.first_event(106)
+        self.assertEqual((name, event_id), ("append", "108"))
+        self.assertEqual(data["blocks"], [107, 108])
+        self.assertEqual(data["baseFeeGwei"], [107.0, 108.0])
+
+    def test_fresh_or_stale_client_gets_snapshot(self):
+        for last_event_id in (None, 90):
+            name, event_id, data = self.first_event(last_event_id)
+            self.assertEqual((name, event_id), ("snapshot", "108"))
+            self.assertEqual(data["blocks"], [104, 105, 106, 107, 108])
+
+
+if __name__ == "__main__":
+    unittest.main()
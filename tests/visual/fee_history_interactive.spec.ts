@@ -43,6 +43,30 @@ async function waitForDerivedChartsIdle(page: Page) {
   await expect(page.locator('#paramsDirtyHint')).toHaveText(/^\s*$/);
 }
 
+type FollowPayload = {
+  datasetId: string;
+  blocks: number[];
+  baseFeeGwei: number[];
+  blobFeeGwei: number[];
+  timeAnchor: null;
+};
+
+function followPayload(firstBlock: number, count: number, baseFeeGwei: number): FollowPayload {
+  const blocks = Array.from({ length: count }, (_, i) => firstBlock + i);
+  return {
+    datasetId: 'live',
+    blocks,
+    baseFeeGwei: blocks.map((_, i) => baseFeeGwei + (i % 7) * 0.5),
+    blobFeeGwei: blocks.map(() => 1),
+    timeAnchor: null,
+  };
+}
+
+function followEvent(name: string, payload: FollowPayload, retryMs: number) {
+  const lastBlock = payload.blocks[payload.blocks.length - 1];
+  return `retry: ${retryMs}\nevent: ${name}\nid: ${lastBlock}\ndata: ${JSON.stringify(payload)}\n\n`;
+}
+
 test.describe('fee_history_interactive visual regression', () => {
   test('current365 default view', async ({ page }) => {
     await openSimulator(page, 'current365', 'Current 365d');
@@ -299,4 +323,79 @@ test.describe('fee_history_interactive visual regression', () => {
     expect(payload.runs?.[0]?.params?.eip1559?.maxChangeDenominator).toBe(12);
     expect(payload.runs?.[0]?.params?.l1GasUsed).toBe(175000);
   });
+
+  test('follow mode appends extend the current run and slide a range pinned to the head', async ({ page }) => {
+    const snapshot = followPayload(20_000_000, 400, 10);
+    const firstAppend = followPayload(20_000_400, 20, 200);
+    const secondAppend = followPayload(20_000_420, 10, 200);
+    const fmt = (block: number) => block.toLocaleString('en-US');
+
+    // Each EventSource (re)connect takes the next response; appends are held
+    // back until the test has checked the state they should change.
+    let releaseFirstAppend!: () => void;
+    let releaseSecondAppend!: () => void;
+    const firstAppendReady = new Promise<void>((resolve) => { releaseFirstAppend = resolve; });
+    const secondAppendReady = new Promise<void>((resolve) => { releaseSecondAppend = resolve; });
+    const lastEventIds: string[] = [];
+    await page.route('**/follow/events', async (route) => {
+      lastEventIds.push(route.request().headers()['last-event-id'] || '');
+      let body = ': idle\n\n';
+      if (lastEventIds.length === 1) {
+        body = followEvent('snapshot', snapshot, 100);
+      } else if (lastEventIds.length === 2) {
+        await firstAppendReady;
+        body = followEvent('append', firstAppend, 100);
+      } else if (lastEventIds.length === 3) {
+        await secondAppendReady;
+        body = followEvent('append', secondAppend, 3_600_000);
+      }
+      await route.fulfill({ status: 200, contentType: 'text/event-stream', body });
+    });
+    await page.addInitScript(() => {
+      window.localStorage.clear();
+      window.sessionStorage.clear();
+    });
+
+    // A stale min/max left in the URL by an earlier session must not pin the
+    // view below the head.
+    await page.goto('/fee_history_interactive.html?follow=1&dataset=live&min=20000010&max=20000020', {
+      waitUntil: 'domcontentloaded',
+    });
+    await expect(page.locator('#minBlock')).toHaveValue(String(snapshot.blocks[0]), { timeout: 30_000 });
+    await expect(page.locator('#maxBlock')).toHaveValue('20000399');
+    await waitForDerivedChartsIdle(page);
+
+    // A constant demand path keeps the incremental run comparable with a full
+    // recompute over the grown window.
+    await page.selectOption('#l2GasScenario', 'constant');
+    await recomputeDerivedCharts(page);
+    const vaultBefore = await page.locator('#latestVaultValue').textContent();
+
+    releaseFirstAppend();
+    await expect(page.locator('#maxBlock')).toHaveValue('20000419', { timeout: 30_000 });
+    await expect(page.locator('#minBlock')).toHaveValue('20000020');
+    expect(lastEventIds.slice(0, 2)).toEqual(['', '20000399']);
+    await expect(page.locator('#latestVaultValue')).not.toHaveText(vaultBefore || '');
+    const vaultAfter = await page.locator('#latestVaultValue').textContent();
+
+    // The current run's range moves with the slide, so it saves as-is.
+    await page.click('#saveRunBtn');
+    await expect(page.locator('#savedRunsStatus')).toHaveText('1 / 6 saved');
+    await expect(page.locator('#savedRunsList')).toContainText(`blocks ${fmt(20_000_020)}-${fmt(20_000_419)}`);
+
+    // Saved runs keep their range on later appends instead of being replayed.
+    releaseSecondAppend();
+    await expect(page.locator('#maxBlock')).toHaveValue('20000429', { timeout: 30_000 });
+    await expect(page.locator('#minBlock')).toHaveValue('20000030');
+    await expect(page.locator('#savedRunsList')).toContainText(`blocks ${fmt(20_000_020)}-${fmt(20_000_419)}`);
+    const chargedAtHead = await page.locator('#latestChargedFee').textContent();
+    const vaultAtHead = await page.locator('#latestVaultValue').textContent();
+    expect(vaultAtHead).not.toBe(vaultAfter);
+
+    // Incrementally extended results match a full recompute over the window.
+    await recomputeDerivedCharts(page);
+    await expect(page.locator('#latestChargedFee')).toHaveText(chargedAtHead || '');
+    await expect(page.locator('#latestVaultValue')).toHaveText(vaultAtHead || '');
+    await expect(page.locator('#maxBlock')).toHaveValue('20000429');
+  });
 });